@@ -86,6 +86,8 @@ class EnvConfig:
     # =============================================================================
     ENABLE_CACHE: bool = os.getenv("ENABLE_CACHE", "true").lower() == "true"
     CACHE_TTL_SECONDS: int = int(os.getenv("CACHE_TTL_SECONDS", "3600"))
+    INDUSTRY_BENCHMARK_CACHE_TTL_SECONDS: int = int(os.getenv("INDUSTRY_BENCHMARK_CACHE_TTL_SECONDS", "300"))
+    CONTENT_CACHE_TTL_SECONDS: int = int(os.getenv("CONTENT_CACHE_TTL_SECONDS", "30"))
     
     # =============================================================================
     # RATE LIMITING
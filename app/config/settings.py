@@ -62,6 +62,8 @@ class Settings(BaseSettings):
     # Cache Configuration - using env_config
     enable_cache: bool = env_config.ENABLE_CACHE
     cache_ttl_seconds: int = env_config.CACHE_TTL_SECONDS
+    industry_benchmark_cache_ttl_seconds: int = env_config.INDUSTRY_BENCHMARK_CACHE_TTL_SECONDS
+    content_cache_ttl_seconds: int = env_config.CONTENT_CACHE_TTL_SECONDS
     
     # Rate Limiting - using env_config
     rate_limit_requests_per_minute: int = env_config.RATE_LIMIT_REQUESTS_PER_MINUTE
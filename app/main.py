@@ -1,5 +1,7 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+import logging
 import warnings
 
 from app.api.routes import router
@@ -9,13 +11,16 @@ from app.database.mongodb import connect_to_mongodb, close_mongodb_connection
 
 warnings.filterwarnings('ignore')
 
+logging.basicConfig(level=settings.log_level, format=settings.log_format)
+
 # Initialize FastAPI app
 app = FastAPI(
     title=settings.app_name,
     description="AI-powered Social Media Intelligence Analysis API",
     version="2.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
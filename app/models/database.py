@@ -1,8 +1,9 @@
-from beanie import Document, Indexed, Link
+from beanie import Document, Indexed, Link, PydanticObjectId
 from pydantic import Field, BaseModel
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
+from pymongo import ASCENDING, DESCENDING, IndexModel
 
 # Enums
 class PlatformType(str, Enum):
@@ -138,8 +139,36 @@ class Post(Document):
             "sentiment",
             "topic",
             "posted_at",
+            IndexModel([("brand.$id", ASCENDING), ("posted_at", ASCENDING)]),
+            IndexModel([("brand.$id", ASCENDING), ("platform", ASCENDING), ("posted_at", DESCENDING)]),
         ]
 
+class PostSample(BaseModel):
+    """Post projection for listings that only show a preview (skips raw_data)"""
+    id: PydanticObjectId = Field(alias="_id")
+    platform: PlatformType
+    text: str
+    sentiment: Optional[SentimentType] = None
+    topic: Optional[str] = None
+    like_count: int = 0
+    comment_count: int = 0
+    share_count: int = 0
+    posted_at: Optional[datetime] = None
+
+class PostAnalysisRow(BaseModel):
+    """Post projection with only the analysis/engagement fields brand result aggregation reads"""
+    platform: Optional[PlatformType] = None
+    like_count: int = 0
+    comment_count: int = 0
+    share_count: int = 0
+    sentiment: Optional[SentimentType] = None
+    topic: Optional[str] = None
+    emotion: Optional[str] = None
+    author_age_group: Optional[str] = None
+    author_gender: Optional[str] = None
+    author_location_hint: Optional[str] = None
+    posted_at: Optional[datetime] = None
+
 class Comment(Document):
     """Comment model - represents a comment on a post"""
     # References
@@ -511,7 +540,7 @@ class PlatformAnalysis(Document):
 
 class BrandAnalysis(Document):
     """Brand Analysis - Main analysis record"""
-    brand_id: Indexed(str)  # Reference to brand
+    brand_id: str  # Reference to brand
     analysis_name: str
     analysis_type: str = "comprehensive"  # comprehensive, sentiment, engagement, etc.
     status: str = "pending"  # pending, running, completed, failed
@@ -535,9 +564,9 @@ class BrandAnalysis(Document):
     class Settings:
         name = "brand_analyses"
         indexes = [
-            "brand_id",
             "status",
             "created_at",
+            IndexModel([("brand_id", ASCENDING), ("created_at", DESCENDING)]),
         ]
 
 class BrandMetrics(Document):
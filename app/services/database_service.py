@@ -1,16 +1,76 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Type
 from datetime import datetime
+import asyncio
+import time
 import uuid
 
+from pydantic import BaseModel
+from pymongo import DESCENDING
+
+from app.config.settings import settings
+
 from app.models.database import (
     Brand, Post, Comment, AnalysisJob,
     AudienceProfile, TopicInterest,
     PlatformType, SentimentType, AnalysisStatusType
 )
 
+# Aggregation expressions shared by the post aggregate queries
+ENGAGEMENT_EXPR = {'$add': [
+    {'$ifNull': ['$like_count', 0]},
+    {'$ifNull': ['$comment_count', 0]},
+    {'$ifNull': ['$share_count', 0]}
+]}
+
+# Positive = 1, Negative = -1, Neutral = 0; posts without sentiment are skipped by $avg
+SENTIMENT_SCORE_EXPR = {'$switch': {
+    'branches': [
+        {'case': {'$eq': ['$sentiment', SentimentType.POSITIVE.value]}, 'then': 1},
+        {'case': {'$eq': ['$sentiment', SentimentType.NEGATIVE.value]}, 'then': -1},
+        {'case': {'$eq': ['$sentiment', SentimentType.NEUTRAL.value]}, 'then': 0}
+    ],
+    'default': None
+}}
+
+# Posts counted towards industry engagement must have likes, comments and shares
+_ENGAGED_POST_EXPR = {'$and': [
+    {'$gt': ['$like_count', 0]},
+    {'$gt': ['$comment_count', 0]},
+    {'$gt': ['$share_count', 0]}
+]}
+
+BRAND_AGGREGATE_GROUP = {'$group': {
+    '_id': None,
+    'total_posts': {'$sum': 1},
+    'total_engagement': {'$sum': ENGAGEMENT_EXPR},
+    'avg_sentiment': {'$avg': SENTIMENT_SCORE_EXPR}
+}}
+
+INDUSTRY_AGGREGATE_GROUP = {'$group': {
+    '_id': None,
+    'total_posts': {'$sum': 1},
+    'engaged_posts': {'$sum': {'$cond': [_ENGAGED_POST_EXPR, 1, 0]}},
+    'engaged_engagement': {'$sum': {'$cond': [_ENGAGED_POST_EXPR, ENGAGEMENT_EXPR, 0]}},
+    'avg_sentiment': {'$avg': SENTIMENT_SCORE_EXPR}
+}}
+
+# Post count and engagement per (platform, sentiment) pair
+BRAND_BREAKDOWN_GROUP = {'$group': {
+    '_id': {'platform': '$platform', 'sentiment': '$sentiment'},
+    'posts': {'$sum': 1},
+    'engagement': {'$sum': ENGAGEMENT_EXPR}
+}}
+
+EMPTY_BRAND_AGGREGATES = {'total_posts': 0, 'total_engagement': 0, 'avg_sentiment': None}
+EMPTY_INDUSTRY_AGGREGATES = {'total_posts': 0, 'engaged_posts': 0, 'engaged_engagement': 0, 'avg_sentiment': None}
+
 class DatabaseService:
     """Service untuk database operations"""
     
+    def __init__(self):
+        # (computed_at, aggregates) for the industry-wide benchmark pipeline
+        self._industry_aggregates_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+    
     # Brand Operations
     async def get_or_create_brand(
         self, 
@@ -154,15 +214,160 @@ class DatabaseService:
         self,
         brand: Brand,
         platform: Optional[PlatformType] = None,
-        limit: int = 100
-    ) -> List[Post]:
-        """Get posts for a brand"""
+        limit: int = 100,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        projection_model: Optional[Type[BaseModel]] = None
+    ) -> List[Any]:
+        """
+        Get posts for a brand, optionally restricted to a posted_at range.
+        With projection_model, only that model's fields are fetched and it is returned instead of Post.
+        """
+        query = self._brand_posts_query(brand, platform, start_date, end_date).limit(limit)
+        if projection_model:
+            query = query.project(projection_model)
+        return await query.to_list()
+    
+    def _brand_posts_query(
+        self,
+        brand: Brand,
+        platform: Optional[PlatformType] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ):
+        """Build the Post query shared by brand post lookups and aggregations"""
         query = Post.find(Post.brand.id == brand.id)
         
         if platform:
             query = query.find(Post.platform == platform)
         
-        return await query.limit(limit).to_list()
+        if start_date or end_date:
+            posted_at = {}
+            if start_date:
+                posted_at['$gte'] = start_date
+            if end_date:
+                posted_at['$lte'] = end_date
+            query = query.find({'posted_at': posted_at})
+        
+        return query
+    
+    async def get_brand_aggregates(
+        self,
+        brand: Brand,
+        platform: Optional[PlatformType] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get post count, total engagement and average sentiment score for a brand.
+        With limit, only the `limit` most recently posted matching posts are aggregated.
+        """
+        query = self._brand_posts_query(brand, platform, start_date, end_date)
+        if limit:
+            pipeline = [{'$sort': {'posted_at': DESCENDING}}, {'$limit': limit}, BRAND_AGGREGATE_GROUP]
+        else:
+            pipeline = [BRAND_AGGREGATE_GROUP]
+        result = await query.aggregate(pipeline).to_list()
+        return result[0] if result else dict(EMPTY_BRAND_AGGREGATES)
+    
+    async def get_brand_breakdown(
+        self,
+        brand: Brand,
+        platform: Optional[PlatformType] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """Get post count and total engagement per platform and sentiment for a brand"""
+        query = self._brand_posts_query(brand, platform, start_date, end_date)
+        return await query.aggregate([BRAND_BREAKDOWN_GROUP]).to_list()
+    
+    async def count_posts_by_brand(
+        self,
+        brand: Brand,
+        platform: Optional[PlatformType] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> int:
+        """Count posts for a brand without loading them"""
+        return await self._brand_posts_query(brand, platform, start_date, end_date).count()
+    
+    async def get_industry_aggregates(self) -> Dict[str, Any]:
+        """
+        Get engagement and sentiment aggregates across all posts.
+        Engagement is only summed over posts with likes, comments and shares.
+        Results are cached for settings.industry_benchmark_cache_ttl_seconds.
+        """
+        cached = self._get_cached_industry_aggregates()
+        if cached is not None:
+            return cached
+        
+        result = await Post.aggregate([INDUSTRY_AGGREGATE_GROUP]).to_list()
+        aggregates = result[0] if result else dict(EMPTY_INDUSTRY_AGGREGATES)
+        self._industry_aggregates_cache = (time.monotonic(), aggregates)
+        return aggregates
+    
+    def _get_cached_industry_aggregates(self) -> Optional[Dict[str, Any]]:
+        """Return the cached industry aggregates if caching is on and they are still fresh"""
+        cached = self._industry_aggregates_cache
+        if settings.enable_cache and cached and time.monotonic() - cached[0] < settings.industry_benchmark_cache_ttl_seconds:
+            return cached[1]
+        return None
+    
+    async def get_competitive_aggregates(
+        self,
+        brand: Brand,
+        platform: Optional[PlatformType] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get brand and industry aggregates.
+        Returns {'brand': ..., 'brand_all': ..., 'industry': ...}; 'brand_all' ignores the
+        date range and is only computed when one is given. While the cached industry
+        aggregates are fresh only the brand's posts are aggregated, through the indexed
+        brand query; otherwise everything is computed in one round trip using $facet.
+        """
+        industry = self._get_cached_industry_aggregates()
+        if industry is not None:
+            if start_date or end_date:
+                brand_stats, brand_all = await asyncio.gather(
+                    self.get_brand_aggregates(brand, platform, start_date, end_date),
+                    self.get_brand_aggregates(brand, platform)
+                )
+            else:
+                brand_stats = brand_all = await self.get_brand_aggregates(brand, platform)
+            return {'brand': brand_stats, 'brand_all': brand_all, 'industry': industry}
+        
+        facets = {
+            'brand': [
+                {'$match': self._brand_posts_query(brand, platform, start_date, end_date).get_filter_query()},
+                BRAND_AGGREGATE_GROUP
+            ]
+        }
+        if start_date or end_date:
+            facets['brand_all'] = [
+                {'$match': self._brand_posts_query(brand, platform).get_filter_query()},
+                BRAND_AGGREGATE_GROUP
+            ]
+        facets['industry'] = [INDUSTRY_AGGREGATE_GROUP]
+        
+        result = await Post.aggregate([{'$facet': facets}]).to_list()
+        facet_result = result[0] if result else {}
+        
+        def first(name, empty):
+            docs = facet_result.get(name)
+            return docs[0] if docs else dict(empty)
+        
+        industry = first('industry', EMPTY_INDUSTRY_AGGREGATES)
+        self._industry_aggregates_cache = (time.monotonic(), industry)
+        
+        brand_stats = first('brand', EMPTY_BRAND_AGGREGATES)
+        return {
+            'brand': brand_stats,
+            'brand_all': first('brand_all', EMPTY_BRAND_AGGREGATES) if 'brand_all' in facets else brand_stats,
+            'industry': industry
+        }
     
     # Comment Operations  
     async def save_comment(
@@ -464,28 +669,31 @@ class DatabaseService:
         self,
         analysis_id: str,
         status: str,
-        total_posts: int = 0,
-        total_engagement: int = 0,
+        total_posts: Optional[int] = None,
+        total_engagement: Optional[int] = None,
         sentiment_distribution: Dict[str, int] = None,
         top_topics: List[str] = None
     ):
-        """Update brand analysis status and results"""
+        """
+        Update brand analysis status and results with a single $set.
+        Result fields are only written when given, so status-only transitions keep stored totals.
+        """
         from app.models.database import BrandAnalysis
         
         from bson import ObjectId
-        analysis = await BrandAnalysis.get(ObjectId(analysis_id))
-        if analysis:
-            analysis.status = status
-            analysis.total_posts = total_posts
-            analysis.total_engagement = total_engagement
-            if sentiment_distribution:
-                analysis.sentiment_distribution = sentiment_distribution
-            if top_topics:
-                analysis.top_topics = top_topics
-            analysis.updated_at = datetime.now()
-            if status == "completed":
-                analysis.completed_at = datetime.now()
-            await analysis.save()
+        now = datetime.now()
+        fields = {"status": status, "updated_at": now}
+        if total_posts is not None:
+            fields["total_posts"] = total_posts
+        if total_engagement is not None:
+            fields["total_engagement"] = total_engagement
+        if sentiment_distribution:
+            fields["sentiment_distribution"] = sentiment_distribution
+        if top_topics:
+            fields["top_topics"] = top_topics
+        if status == "completed":
+            fields["completed_at"] = now
+        await BrandAnalysis.find_one(BrandAnalysis.id == ObjectId(analysis_id)).update({"$set": fields})
     
     async def save_brand_metrics(
         self,
@@ -622,6 +830,14 @@ class DatabaseService:
         from app.models.database import BrandAnalysis
         return await BrandAnalysis.find_one(BrandAnalysis.id == analysis_id)
     
+    async def get_latest_brand_analysis(self, brand_id: str):
+        """Get the most recently created brand analysis for a brand"""
+        from app.models.database import BrandAnalysis
+        return await BrandAnalysis.find_one(
+            BrandAnalysis.brand_id == brand_id,
+            sort=[("created_at", DESCENDING)]
+        )
+    
     async def get_brand_metrics(self, brand_analysis_id: str):
         """Get brand metrics by analysis ID"""
         from app.models.database import BrandMetrics
@@ -1,9 +1,94 @@
+import os
 import pandas as pd
-from typing import List, Dict, Any, Optional
+import ijson
+import orjson
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 from datetime import datetime
+from functools import lru_cache
 import re
 from collections import Counter
 
+# Scraped files larger than this are stream-parsed instead of loaded whole
+STREAM_JSON_THRESHOLD_BYTES = 1024 * 1024
+
+def iter_json_records(file_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the records of a scraped JSON array file one at a time.
+    Small files are parsed in one go with orjson; larger ones are streamed with ijson
+    so only the current record is held in memory.
+    """
+    with open(file_path, 'rb') as f:
+        if os.path.getsize(file_path) < STREAM_JSON_THRESHOLD_BYTES:
+            yield from orjson.loads(f.read())
+        else:
+            yield from ijson.items(f, 'item', use_float=True)
+
+@lru_cache(maxsize=16)
+def _load_json_file(file_path: str, mtime_ns: int, size: int):
+    """Parse a JSON array file once per (path, mtime, size) version"""
+    with open(file_path, 'rb') as f:
+        data = orjson.loads(f.read())
+    return tuple(data) if isinstance(data, list) else data
+
+def load_json_cached(file_path: str):
+    """
+    Load the records of a scraped JSON array file, reusing the parsed result while the
+    file is unchanged on disk. Arrays come back as tuples, but the record dicts are shared
+    between callers, so copy a record before adding or changing keys on it.
+    """
+    st = os.stat(file_path)
+    return _load_json_file(file_path, st.st_mtime_ns, st.st_size)
+
+def records_to_dataframe(records, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    Build a DataFrame from scraped records.
+    When columns is given, records are pruned to those keys before the frame is built,
+    so large nested fields (comments, child posts, ...) never become DataFrame columns.
+    """
+    if columns is not None:
+        wanted = frozenset(columns)
+        records = [{key: value for key, value in record.items() if key in wanted} for record in records]
+    return pd.DataFrame(records)
+
+@lru_cache(maxsize=256)
+def _scraped_file_patterns(brand_name: str, data_type: str):
+    """Compiled filename patterns for a brand's new-format and legacy scraped files"""
+    brand = re.escape(brand_name)
+    return (
+        re.compile(rf'dataset_(\w+)-scraper_{re.escape(data_type)}_{brand}_.*\.json'),
+        re.compile(rf'dataset_(\w+)-scraper_{brand}\.json'),
+    )
+
+def index_scraped_files(scraping_data_dir: str, brand_name: str, data_type: str = 'brand') -> Dict[str, Dict[str, Any]]:
+    """
+    Index a brand's scraped files with a single os.scandir pass.
+    Returns {platform: {'latest': newest new-format path (by ctime) or None,
+    'count': number of new-format files, 'legacy': legacy file path or None}}.
+    """
+    new_pattern, legacy_pattern = _scraped_file_patterns(brand_name, data_type)
+    index = {}
+    newest_ctime = {}
+    
+    with os.scandir(scraping_data_dir) as entries:
+        for entry in entries:
+            match = new_pattern.fullmatch(entry.name)
+            if match:
+                platform = match.group(1)
+                info = index.setdefault(platform, {'latest': None, 'count': 0, 'legacy': None})
+                info['count'] += 1
+                ctime = entry.stat().st_ctime
+                if info['latest'] is None or ctime > newest_ctime[platform]:
+                    info['latest'] = entry.path
+                    newest_ctime[platform] = ctime
+                continue
+            
+            match = legacy_pattern.fullmatch(entry.name)
+            if match:
+                info = index.setdefault(match.group(1), {'latest': None, 'count': 0, 'legacy': None})
+                info['legacy'] = entry.path
+    
+    return index
+
 def remove_duplicates(data: List[str], platform: str) -> List[str]:
     """Remove duplicate texts from list"""
     unique_data = []
@@ -65,41 +150,25 @@ def consolidate_demographics(demographics: List[Dict[str, Any]]) -> Dict[str, An
     if not demographics:
         return {}
     
-    # Process age groups
-    age_groups = {}
+    age_groups = Counter()
+    gender_dist = Counter()
+    locations = Counter()
+    
     for demo in demographics:
+        # Process age groups - normalize age group labels
         age_group = demo.get('age_group', 'unknown')
         if age_group and age_group != 'unknown':
-            # Normalize age group labels
-            normalized_age = normalize_age_group(age_group)
-            if normalized_age in age_groups:
-                age_groups[normalized_age] += 1
-            else:
-                age_groups[normalized_age] = 1
-    
-    # Process gender distribution
-    gender_dist = {}
-    for demo in demographics:
+            age_groups[normalize_age_group(age_group)] += 1
+        
+        # Process gender distribution - merge 'or' combinations into neutral
         gender = demo.get('gender', 'unknown')
         if gender and gender != 'unknown':
-            # Normalize gender labels - merge 'or' combinations into neutral
-            normalized_gender = normalize_gender(gender)
-            if normalized_gender in gender_dist:
-                gender_dist[normalized_gender] += 1
-            else:
-                gender_dist[normalized_gender] = 1
-    
-    # Process location distribution
-    locations = {}
-    for demo in demographics:
+            gender_dist[normalize_gender(gender)] += 1
+        
+        # Process location distribution - normalize location labels
         location = demo.get('location_hint', 'unknown')
         if location and location != 'unknown':
-            # Normalize location labels
-            normalized_location = normalize_location(location)
-            if normalized_location in locations:
-                locations[normalized_location] += 1
-            else:
-                locations[normalized_location] = 1
+            locations[normalize_location(location)] += 1
     
     return {
         'age_groups': age_groups,
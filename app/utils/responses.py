@@ -0,0 +1,16 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+class DirectORJSONResponse(ORJSONResponse):
+    """
+    ORJSONResponse for endpoints that return the response object themselves,
+    skipping FastAPI's jsonable_encoder pass over large payloads.
+    Serializes numpy values natively and falls back to str() for anything else
+    orjson does not know (ObjectId, Decimal, ...).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str, option=orjson.OPT_SERIALIZE_NUMPY)